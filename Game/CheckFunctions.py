@@ -1,3 +1,11 @@
+'''
+Directions to look for attackers in, built once
+'''
+DIAGONAL_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+LINEAR_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+KNIGHT_DIRECTIONS = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
+
+
 '''
 function to reset check
 '''
@@ -12,17 +20,19 @@ check if a piece is pined
 '''
 def is_pinned(self, row , col):
     opponent = "black" if self.to_move == 'white' else "white"
+    king_row , king_col = self.king_positions[self.to_move]
     '''
     diagonal checks
     '''
-    directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+    directions = DIAGONAL_DIRECTIONS
     for direction in directions:
         found = False
         for i in range(1,8):
-            end_row = self.king_positions[self.to_move][0] + direction[0] * i
-            end_col = self.king_positions[self.to_move][1] + direction[1] * i
+            end_row = king_row + direction[0] * i
+            end_col = king_col + direction[1] * i
             if(end_row <= 7 and end_row >= 0 and end_col <= 7 and end_col >= 0):
-                if self.state[end_row][end_col] != None :
+                target = self.state[end_row][end_col]
+                if target != None :
                     if not found:
                         '''
                         Found the piece before opponent
@@ -32,8 +42,8 @@ def is_pinned(self, row , col):
                         else: 
                             break 
                     else:           
-                        if self.state[end_row][end_col].color == opponent:
-                            if self.state[end_row][end_col].type == "bishop" or self.state[end_row][end_col].type == "queen":
+                        if target.color == opponent:
+                            if target.type == "bishop" or target.type == "queen":
                                 return direction
                         break
             else:
@@ -42,14 +52,15 @@ def is_pinned(self, row , col):
     '''
     horizontal and vertical checks
     '''
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    directions = LINEAR_DIRECTIONS
     for direction in directions:
         found = False
         for i in range(1,8):
-            end_row = self.king_positions[self.to_move][0] + direction[0] * i
-            end_col = self.king_positions[self.to_move][1] + direction[1] * i
+            end_row = king_row + direction[0] * i
+            end_col = king_col + direction[1] * i
             if(end_row <= 7 and end_row >= 0 and end_col <= 7 and end_col >= 0):
-                if self.state[end_row][end_col] != None :
+                target = self.state[end_row][end_col]
+                if target != None :
                     if not found:
                         '''Found the piece before opponent'''
                         if(end_row == row and col == end_col):
@@ -57,8 +68,8 @@ def is_pinned(self, row , col):
                         else: 
                             break 
                     else:           
-                        if self.state[end_row][end_col].color == opponent:
-                            if self.state[end_row][end_col].type == "rook" or self.state[end_row][end_col].type == "queen":
+                        if target.color == opponent:
+                            if target.type == "rook" or target.type == "queen":
                                 return direction
                         break
             else:
@@ -70,13 +81,14 @@ checks if the king is in check
 def in_check(self , pos = None):
     opponent = "black" if self.to_move == "white" else "white"
     
-    king = self.state[self.king_positions[self.to_move][0]][self.king_positions[self.to_move][1]]
+    king_row , king_col = self.king_positions[self.to_move]
+    king = self.state[king_row][king_col]
     if pos:
         king_pos = pos
         '''
         Remove existing king from the board
         '''
-        self.state[self.king_positions[self.to_move][0]][self.king_positions[self.to_move][1]] = None
+        self.state[king_row][king_col] = None
     else:
         king_pos = self.king_positions[self.to_move]
 
@@ -85,15 +97,16 @@ def in_check(self , pos = None):
     Diagonal checks
     '''
     def diagonal():
-        directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+        directions = DIAGONAL_DIRECTIONS
         for direction in directions:
             for i in range(1,8):
                 end_row = king_pos[0] + direction[0] * i
                 end_col = king_pos[1] + direction[1] * i
                 if(end_row <= 7 and end_row >= 0 and end_col <= 7 and end_col >= 0):
-                    if self.state[end_row][end_col] != None:
-                        if self.state[end_row][end_col].color == opponent:
-                            if self.state[end_row][end_col].type == "bishop" or self.state[end_row][end_col].type == "queen":
+                    target = self.state[end_row][end_col]
+                    if target != None:
+                        if target.color == opponent:
+                            if target.type == "bishop" or target.type == "queen":
                                 return (direction , (end_row, end_col))
                         break
                 else:
@@ -104,15 +117,16 @@ def in_check(self , pos = None):
     Horizontal and vertical checks
     '''
     def linear():
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        directions = LINEAR_DIRECTIONS
         for direction in directions:
             for i in range(1,8):
                 end_row = king_pos[0] + direction[0] * i
                 end_col = king_pos[1] + direction[1] * i
                 if(end_row <= 7 and end_row >= 0 and end_col <= 7 and end_col >= 0):
-                    if self.state[end_row][end_col] != None:
-                        if self.state[end_row][end_col].color == opponent:
-                            if self.state[end_row][end_col].type == "rook" or self.state[end_row][end_col].type == "queen":
+                    target = self.state[end_row][end_col]
+                    if target != None:
+                        if target.color == opponent:
+                            if target.type == "rook" or target.type == "queen":
                                 return (direction , (end_row, end_col))
                         break
                 else:
@@ -125,14 +139,15 @@ def in_check(self , pos = None):
     Knight checks
     '''
     def knight():
-        directions = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)]
+        directions = KNIGHT_DIRECTIONS
         for direction in directions:
             end_row = king_pos[0] + direction[0]
             end_col = king_pos[1] + direction[1]
             if(end_row <= 7 and end_row >= 0 and end_col <= 7 and end_col >= 0):
-                if self.state[end_row][end_col] != None:
-                    if self.state[end_row][end_col].color == opponent:
-                        if self.state[end_row][end_col].type == "knight":
+                target = self.state[end_row][end_col]
+                if target != None:
+                    if target.color == opponent:
+                        if target.type == "knight":
                             return (direction , (end_row, end_col))
         return None
     
@@ -173,5 +188,5 @@ def in_check(self , pos = None):
     '''
     Add the king back to the board
     '''
-    self.state[self.king_positions[self.to_move][0]][self.king_positions[self.to_move][1]] = king
+    self.state[king_row][king_col] = king
     return checks 
@@ -1,5 +1,3 @@
-import numpy as np
-
 """
 Every legal move is an dictionary in the format
 move = {
@@ -18,6 +16,16 @@ check = {
 """
 
 
+'''
+Directions in which each piece can move, built once
+'''
+ROOK_DIRECTIONS = ((-1, 0), (0, -1), (1, 0), (0, 1))
+BISHOP_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+KNIGHT_DIRECTIONS = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
+QUEEN_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1), (-1, 0), (0, -1), (0, 1), (1, 0))
+KING_DIRECTIONS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
 '''
 Squared Magnitude of two points to avoid precision
 '''
@@ -25,6 +33,14 @@ def mag(a):
     return a[0]**2 + a[1]**2
 
 
+'''
+Check if two vectors point the same way by comparing their signed squares scaled by the squared magnitudes
+Cross multiplied so everything stays in integers
+'''
+def same_direction(a , a_mag , b , b_mag):
+    return a[0]*abs(a[0])*b_mag == b[0]*abs(b[0])*a_mag and a[1]*abs(a[1])*b_mag == b[1]*abs(b[1])*a_mag
+
+
 
 def get_legal_moves(self, pos):
     moves = []
@@ -78,16 +94,18 @@ def get_legal_moves(self, pos):
             '''
             legal_moves = []
             
-            king_to_attacker = np.array(self.king_positions[self.to_move]) -  np.array(self.checks[0]["pos"])
+            king = self.king_positions[self.to_move]
+            attacker = self.checks[0]["pos"]
+            king_to_attacker = (king[0] - attacker[0] , king[1] - attacker[1])
             k_t_a_mag = mag(king_to_attacker)
             for move in moves:
                 '''
                 find the vector from the king to the move
                 '''
-                king_to_move = np.array(self.king_positions[self.to_move]) - np.array(move["to"])
+                king_to_move = (king[0] - move["to"][0] , king[1] - move["to"][1])
                 k_t_m_mag = mag(king_to_move)
 
-                if(k_t_m_mag <= k_t_a_mag and (king_to_move**2*np.sign(king_to_move)/k_t_m_mag == king_to_attacker**2*np.sign(king_to_attacker)/k_t_a_mag).all()):
+                if(k_t_m_mag and k_t_m_mag <= k_t_a_mag and same_direction(king_to_move , k_t_m_mag , king_to_attacker , k_t_a_mag)):
                     '''
                     The piece blocks or captures the check
                     '''
@@ -202,7 +220,7 @@ def rook_moves(self , row , col):
     '''
     directions in which a rook can move
     '''
-    directions = [(-1, 0), (0, -1), (1, 0), (0, 1)]
+    directions = ROOK_DIRECTIONS
 
 
     '''
@@ -223,12 +241,13 @@ def rook_moves(self , row , col):
             end_row = row + direction[0] * i
             end_col = col + direction[1] * i
             if(end_row <= 7 and end_row >= 0 and end_col <= 7 and end_col >= 0):
-                if self.state[end_row][end_col] == None:
+                target = self.state[end_row][end_col]
+                if target == None:
                     '''
                     move is valid if the space is empty
                     '''
                     moves.append({"to": (end_row,end_col) , "special" : None})
-                elif self.state[end_row][end_col].color == opponent:
+                elif target.color == opponent:
                     moves.append({"to": (end_row,end_col) , "special" : None})
                     '''
                     stop when you hit an opponent piece
@@ -255,7 +274,7 @@ def bishop_moves(self , row , col):
     '''
     directions in which a bishop can move
     '''
-    directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+    directions = BISHOP_DIRECTIONS
 
 
     '''
@@ -277,12 +296,13 @@ def bishop_moves(self , row , col):
             end_row = row + direction[0] * i
             end_col = col + direction[1] * i
             if(end_row <= 7 and end_row >= 0 and end_col <= 7 and end_col >= 0):
-                if self.state[end_row][end_col] == None:
+                target = self.state[end_row][end_col]
+                if target == None:
                     '''
                     move is valid if the space is empty
                     '''
                     moves.append({"to": (end_row,end_col) , "special" : None})
-                elif self.state[end_row][end_col].color == opponent:
+                elif target.color == opponent:
                     moves.append({"to": (end_row,end_col) , "special" : None})
                     '''
                     stop when you hit an opponent piece
@@ -310,7 +330,7 @@ def knight_moves(self , row , col):
     '''
     directions in which a knight can move
     '''
-    directions = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)]
+    directions = KNIGHT_DIRECTIONS
     
 
 
@@ -329,12 +349,13 @@ def knight_moves(self , row , col):
         end_row = row + direction[0]
         end_col = col + direction[1]
         if(end_row <= 7 and end_row >= 0 and end_col <= 7 and end_col >= 0):
-            if self.state[end_row][end_col] == None:
+            target = self.state[end_row][end_col]
+            if target == None:
                 '''
                 move is valid if the space is empty
                 '''
                 moves.append({"to": (end_row,end_col) , "special" : None})
-            elif self.state[end_row][end_col].color == opponent:
+            elif target.color == opponent:
                 '''
                 move is valid if the space is occupied by an opponent piece
                 '''
@@ -351,7 +372,7 @@ def queen_moves(self , row , col):
     '''
     directions in which a queen can move
     '''
-    directions = [(-1, -1), (-1, 1), (1, -1), (1, 1), (-1, 0), (0, -1), (0, 1), (1, 0)]
+    directions = QUEEN_DIRECTIONS
     
     '''
     Check if the queen is pinned
@@ -371,12 +392,13 @@ def queen_moves(self , row , col):
             end_row = row + direction[0] * i
             end_col = col + direction[1] * i
             if(end_row <= 7 and end_row >= 0 and end_col <= 7 and end_col >= 0):
-                if self.state[end_row][end_col] == None:
+                target = self.state[end_row][end_col]
+                if target == None:
                     '''
                     move is valid if the space is empty
                     '''
                     moves.append({"to": (end_row,end_col) , "special" : None})
-                elif self.state[end_row][end_col].color == opponent:
+                elif target.color == opponent:
                     moves.append({"to": (end_row,end_col) , "special" : None})
                     '''
                     stop when you hit an opponent piece
@@ -426,18 +448,19 @@ def king_moves(self , row , col):
     '''
     directions in which a king can move
     '''
-    directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+    directions = KING_DIRECTIONS
     opponent = "black" if self.to_move == 'white' else "white"
     for direction in directions:
         end_row = row + direction[0]
         end_col = col + direction[1]
         if(end_row <= 7 and end_row >= 0 and end_col <= 7 and end_col >= 0):
-            if self.state[end_row][end_col] == None and len(self.in_check((end_row, end_col))) == 0:
+            target = self.state[end_row][end_col]
+            if target == None and len(self.in_check((end_row, end_col))) == 0:
                 '''
                 move is valid if the space is empty and not in check
                 '''
                 moves.append({"to": (end_row,end_col) , "special" : None})
-            elif self.state[end_row][end_col] and self.state[end_row][end_col].color == opponent and len(self.in_check((end_row, end_col))) == 0:
+            elif target and target.color == opponent and len(self.in_check((end_row, end_col))) == 0:
                 '''
                 move is valid if the space is occupied by an opponent piece
                 '''
@@ -20,16 +20,16 @@ class Board:
         '''
 
 
+        back_rank = ["rook", "knight", "bishop", "queen", "king", "bishop", "knight", "rook"]
         self.state = [
-                [Piece("black", "rook"), Piece("black", "knight"), Piece("black", "bishop"), Piece("black", "queen"), Piece("black", "king"), Piece("black", "bishop"), Piece("black", "knight"), Piece("black", "rook")],
-                [Piece("black", "pawn"), Piece("black", "pawn"), Piece("black", "pawn"), Piece("black", "pawn"), Piece("black", "pawn"), Piece("black", "pawn"), Piece("black", "pawn"), Piece("black", "pawn")],
-                [None, None, None, None, None, None, None, None],
-                [None, None, None, None, None, None, None, None],
-                [None, None, None, None, None, None, None, None],
-                [None, None, None, None, None, None, None, None],
-                [Piece("white", "pawn"), Piece("white", "pawn"), Piece("white", "pawn"), Piece("white", "pawn"), Piece("white", "pawn"), Piece("white", "pawn"), Piece("white", "pawn"),Piece("white", "pawn")],
-                [Piece("white", "rook"), Piece("white", "knight"), Piece("white", "bishop"),Piece("white", "queen"), Piece("white", "king"),Piece("white", "bishop"),Piece("white", "knight"), Piece("white", "rook")]]
-                # [Piece("white", "rook"), None,None,None, Piece("white", "king"),None,None, Piece("white", "rook")]]
+                [Piece("black", piece) for piece in back_rank],
+                [Piece("black", "pawn") for _ in range(8)],
+                [None] * 8,
+                [None] * 8,
+                [None] * 8,
+                [None] * 8,
+                [Piece("white", "pawn") for _ in range(8)],
+                [Piece("white", piece) for piece in back_rank]]
 
         self.to_move = "white"
         self.move_log = []
@@ -66,25 +66,27 @@ class Board:
     def move(self,initial,move):
         self.reset_check()
         final = move["to"]
+        special = move["special"]
+        special_info = move.get("special_info")
         '''
         Add move to the move_log
         '''
         self.move_log.append({
             "initial": initial,
             "final": final,
-            "special": move["special"],
+            "special": special,
             "initial_piece": self.state[initial[0]][initial[1]],
             "final_piece": self.state[final[0]][final[1]],
             "castling" : self.castling[self.to_move].copy(),
-            "special_info": None if "special_info" not in move else move["special_info"]
+            "special_info": special_info
         })
 
         '''
         Check for catling moves
         '''
-        if (move["special"] == "KSC" or move["special"] == "QSC"):
+        if (special == "KSC" or special == "QSC"):
             self.castling[self.to_move]["allowed"] = False            
-            if(move["special"] == "KSC"):
+            if(special == "KSC"):
                 self.state[final[0]][final[1]] , self.state[initial[0]][initial[1]] = self.state[initial[0]][initial[1]] , None
                 self.state[initial[0]][5] , self.state[initial[0]][7]= self.state[initial[0]][7],None
                 self.castling[self.to_move]["king"] = False
@@ -93,20 +95,21 @@ class Board:
                 self.state[final[0]][final[1]] , self.state[initial[0]][initial[1]] = self.state[initial[0]][initial[1]] , None
                 self.state[initial[0]][3] , self.state[initial[0]][0]= self.state[initial[0]][0],None
             
-        elif(move["special"] == "EP"):
+        elif(special == "EP"):
             self.state[final[0]][final[1]] , self.state[initial[0]][initial[1]] = self.state[initial[0]][initial[1]] , None
-            self.state[initial[0]][final[1]] , self.state[move["special_info"][0]][move["special_info"][1]] = None,None
+            self.state[initial[0]][final[1]] , self.state[special_info[0]][special_info[1]] = None,None
         
 
-        elif(move["special"] == "promotion"):
+        elif(special == "promotion"):
             self.state[final[0]][final[1]] = Piece(self.to_move,"queen")
             self.state[initial[0]][initial[1]] = None
         else:
+            piece = self.state[initial[0]][initial[1]]
 
             '''
             Checking if the king moved
             '''
-            if(self.state[initial[0]][initial[1]].type == "king"):
+            if(piece.type == "king"):
                 self.king_positions[self.to_move] = final
                 '''
                 Remove castling rights
@@ -119,7 +122,7 @@ class Board:
             '''
             Checking if the rook moved
             '''
-            if(self.state[initial[0]][initial[1]].type == "rook"):
+            if(piece.type == "rook"):
                 if(initial[1] == 0 and self.castling[self.to_move]["king"]):
                     self.castling[self.to_move]["king"] = False
                 if(initial[1] == 7 and self.castling[self.to_move]["queen"]):
@@ -130,13 +133,13 @@ class Board:
             '''
             Checking if the pawn moved
             '''
-            if(self.state[initial[0]][initial[1]].type == "pawn"):
+            if(piece.type == "pawn"):
                 if(abs(initial[0] - final[0]) == 2):
-                    self.state[initial[0]][initial[1]].en_passant = True
+                    piece.en_passant = True
                 else:
-                    self.state[initial[0]][initial[1]].en_passant = False
+                    piece.en_passant = False
 
-            self.state[final[0]][final[1]] = self.state[initial[0]][initial[1]]
+            self.state[final[0]][final[1]] = piece
             self.state[initial[0]][initial[1]] = None
 
 
@@ -171,9 +174,10 @@ class Board:
         move = self.move_log.pop()
         initial = move["initial"]
         final = move["final"]
+        special = move["special"]
 
-        if(move["special"] == "KSC" or move["special"] == "QSC"):
-            if(move["special"] == "KSC"):
+        if(special == "KSC" or special == "QSC"):
+            if(special == "KSC"):
                 self.state[initial[0]][4] , self.state[initial[0]][7] = self.state[initial[0]][6] , self.state[initial[0]][5]
                 self.state[initial[0]][5] , self.state[initial[0]][6] = None , None
             else:
@@ -181,7 +185,7 @@ class Board:
                 self.state[initial[0]][3] , self.state[initial[0]][2] = None , None
         
         
-        elif(move["special"] == "EP"):
+        elif(special == "EP"):
             self.state[initial[0]][initial[1]] , self.state[final[0]][final[1]] = self.state[final[0]][final[1]] , self.state[initial[0]][initial[1]]
             self.state[final[0]][final[1]] , self.state[move["special_info"][0]][move["special_info"][1]] = None,Piece(self.to_move , "pawn" , True)
 
@@ -13,8 +13,8 @@ Declaring Constants
 # COLORS 
 LIGHT = (241,218,179)
 DARK = (182,136,96)
-LIGHT_SELECTED = "#00BCD4"
-DARK_SELECTED = "#08a8c6"
+LIGHT_SELECTED = pygame.Color("#00BCD4")
+DARK_SELECTED = pygame.Color("#08a8c6")
 
 HILIGHT = (0,188,212 , 50)
 HILIGHT_CAPTURE = (173,238,126 , 150)
@@ -43,6 +43,21 @@ for piece in pieces:
     IMAGES["black"][piece] = pygame.image.load("images/black/" + piece + ".png")
     IMAGES["white"][piece] = pygame.image.load("images/white/" + piece + ".png")
 
+#building the translucent hilight squares once
+HILIGHT_SURFACES = {}
+for hilight in [HILIGHT , HILIGHT_CAPTURE]:
+    HILIGHT_SURFACES[hilight] = pygame.Surface((PIECE_HEIGHT , PIECE_HEIGHT), pygame.SRCALPHA)
+    HILIGHT_SURFACES[hilight].fill(hilight)
+
+#square geometry computed once
+SQUARES = [[pygame.Rect(j*PIECE_HEIGHT, i*PIECE_HEIGHT, PIECE_HEIGHT, PIECE_HEIGHT) for j in range(DIMENSION)] for i in range(DIMENSION)]
+
+#drawing the empty board once
+BOARD = pygame.Surface((WIDTH , HEIGHT))
+for i in range(DIMENSION):
+    for j in range(DIMENSION):
+        pygame.draw.rect(BOARD, COLORS[(i+j)%2], SQUARES[i][j])
+
 
 
 
@@ -55,38 +70,42 @@ class Game:
         self.screen = pygame.display.set_mode((WIDTH , HEIGHT))        
         self.running = True
         self.square_selected = (-1,-1)
+        self.redraw = True
 
     #drawing things
     def draw(self):
-        pygame.display.flip()
-        self.screen.fill((0,0,255))
+        self.screen.blit(BOARD , (0,0))
+        if(self.square_selected != (-1,-1)):
+            i , j = self.square_selected
+            pygame.draw.rect(self.screen, COLORS[(i+j)%2 + 2], SQUARES[i][j])
+
+        targets = {move["to"] for move in self.legal_moves}
         for i in range(DIMENSION):
             for j in range(DIMENSION):
-                if(self.square_selected == (i,j)):
-                    color = COLORS[(i+j)%2 + 2]
-                else:
-                    color = COLORS[(i+j)%2]
-
-                pygame.draw.rect(self.screen, color, pygame.Rect(j*PIECE_HEIGHT, i*PIECE_HEIGHT, PIECE_HEIGHT, PIECE_HEIGHT))
                 piece = self.board.state[i][j]
                
                 # hilight the possible moves
-                if((i,j) in [move["to"] for move in self.legal_moves]):
-                    if(self.board.state[i][j] and (i,j) != self.square_selected):
-                        draw_rect_alpha(self.screen, HILIGHT_CAPTURE, pygame.Rect(j*PIECE_HEIGHT, i*PIECE_HEIGHT, PIECE_HEIGHT, PIECE_HEIGHT))
+                if((i,j) in targets):
+                    if(piece and (i,j) != self.square_selected):
+                        self.screen.blit(HILIGHT_SURFACES[HILIGHT_CAPTURE] , SQUARES[i][j])
                     else:   
-                        draw_rect_alpha(self.screen, HILIGHT, pygame.Rect(j*PIECE_HEIGHT, i*PIECE_HEIGHT, PIECE_HEIGHT, PIECE_HEIGHT))
+                        self.screen.blit(HILIGHT_SURFACES[HILIGHT] , SQUARES[i][j])
 
 
                 if(piece):
-                    self.screen.blit(IMAGES[piece.color][piece.type] ,( j*PIECE_HEIGHT, i*PIECE_HEIGHT))
+                    self.screen.blit(IMAGES[piece.color][piece.type] , SQUARES[i][j])
                 
     def run(self):
         while self.running:
             self.events()
             # self.update()
-            self.draw()
-            pygame.display.update()
+            '''
+            Only redraw when something changed on the board
+            '''
+            if(self.redraw):
+                self.draw()
+                pygame.display.update()
+                self.redraw = False
             CLOCK.tick(FPS)
 
     '''
@@ -96,6 +115,7 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.MOUSEBUTTONDOWN:
                 self.click_handler()
+                self.redraw = True
             elif event.type == pygame.QUIT:
                 self.running = False
                 pygame.quit()
@@ -103,6 +123,9 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_z:
                     self.board.undo()
+                    self.redraw = True
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.redraw = True
 
 
     '''
@@ -129,7 +152,7 @@ class Game:
                 '''
                 found = False
                 for move in self.legal_moves:
-                    if(move["to"] == pos and not found):
+                    if(move["to"] == pos):
                         found = True
                         '''
                         Move is legal
@@ -141,6 +164,7 @@ class Game:
                             '''
                         self.square_selected = (-1,-1)
                         self.legal_moves = []
+                        break
                 if(pos == self.square_selected and not found):
                     '''
                     Deselecting the piece
@@ -160,15 +184,6 @@ class Game:
 
                     
 
-'''
-Drawing Functions
-''' 
-def draw_rect_alpha(surface, color, rect):
-    shape_surf = pygame.Surface(pygame.Rect(rect).size, pygame.SRCALPHA)
-    pygame.draw.rect(shape_surf, color, shape_surf.get_rect())
-    surface.blit(shape_surf, rect)
-
-
 
 '''
 Main Function
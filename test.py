@@ -1,12 +1,14 @@
 from Game import Board
 import copy
+import sys
+import cProfile
 total = 0
-board = Board()
+MAX_DEPTH = 6
 
 
 def temp(b , depth):
     total = 0
-    if depth == 6:
+    if depth == MAX_DEPTH:
         
         for i in range(8):
             for j in range(8):
@@ -24,4 +26,15 @@ def temp(b , depth):
         print(total)
     return total
 
-print(temp(board, 0))
+'''
+usage: python test.py [depth] [--profile]
+'''
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--profile"]
+    if args:
+        MAX_DEPTH = int(args[0])
+    board = Board()
+    if "--profile" in sys.argv:
+        cProfile.run("print(temp(board, 0))", sort="cumulative")
+    else:
+        print(temp(board, 0))